@@ -6,151 +6,345 @@ with Google Maps grounding.
 """
 
 import asyncio
-import sys
+import io
 import os
+import time
+from collections import OrderedDict
+from typing import NamedTuple, Optional
 
-# Add the parent directory to the path so we can import our agent
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-
+from google.adk.agents.run_config import RunConfig, StreamingMode
 from google.adk.runners import Runner
 from google.adk.sessions import InMemorySessionService
 from google.genai.types import Content, Part
 from location_agent.agent import root_agent
+from location_agent.events import close_events
 
 
-async def create_agent_runner():
-    """Create and return an agent runner."""
-    session_service = InMemorySessionService()
-    app_name = "location_aware_app"
+class Example(NamedTuple):
+    """One example question and how it is shown in the output."""
 
-    runner = Runner(
-        agent=root_agent,
-        app_name=app_name,
-        session_service=session_service
-    )
+    topic: str  # examples that share a topic are asked in order on the same session
+    heading: str
+    width: int  # length of the underline printed below the heading
+    question: str
+    shown_question: str  # shorter form of the question printed with the answer
+    latitude: Optional[float] = None
+    longitude: Optional[float] = None
 
-    # Create a session
-    user_id = "demo_user"
-    session_id = "demo_session"
 
-    await session_service.create_session(
-        app_name=app_name,
-        user_id=user_id,
-        session_id=session_id
-    )
-
-    return runner, user_id, session_id
-
-
-async def ask_agent(runner, user_id, session_id, question, latitude=None, longitude=None):
-    """Ask the agent a question."""
+EXAMPLES = [
+    Example(
+        topic="nyc",
+        heading="1. 🍽️ Finding Restaurants",
+        width=30,
+        question="What are some good restaurants near Times Square in New York?",
+        shown_question="What are some good restaurants near Times Square in New York?",
+        latitude=40.7580,  # Times Square coordinates
+        longitude=-73.9855,
+    ),
+    Example(
+        topic="paris",
+        heading="2. ✈️ Travel Recommendations",
+        width=30,
+        question="I'm visiting Paris for 3 days. What are the must-see attractions and good places to eat?",
+        shown_question="I'm visiting Paris for 3 days. What are the must-see attractions and good places to eat?",
+        latitude=48.8566,  # Paris coordinates
+        longitude=2.3522,
+    ),
+    Example(
+        topic="tokyo",
+        heading="3. 🕐 Local Information",
+        width=25,
+        question="What time is it in Tokyo right now? Also, what's the weather like there?",
+        shown_question="What time is it in Tokyo right now? Also, what's the weather like there?",
+    ),
+    Example(
+        topic="paris",
+        heading="4. 🗺️ Directions and Navigation",
+        width=35,
+        question="How do I get from the Eiffel Tower to the Louvre Museum in Paris? What's the best way to travel?",
+        shown_question="How do I get from the Eiffel Tower to the Louvre Museum in Paris?",
+        latitude=48.8584,  # Eiffel Tower coordinates
+        longitude=2.2945,
+    ),
+    Example(
+        topic="nyc",
+        heading="5. 🏨 Hotel and Accommodation",
+        width=30,
+        question="I need a hotel near Central Park in New York. What are some good options with good reviews?",
+        shown_question="I need a hotel near Central Park in New York. What are some good options?",
+        latitude=40.7829,  # Central Park coordinates
+        longitude=-73.9654,
+    ),
+    Example(
+        topic="london",
+        heading="6. 📏 Distance and Travel Time",
+        width=35,
+        question="How far is it from London to Paris? What are the different ways to travel between these cities?",
+        shown_question="How far is it from London to Paris? What are the travel options?",
+    ),
+]
+
+# Location-context parts for the example coordinates, built once so asking about
+# a known location reuses the same Part instead of rebuilding the text each call
+KNOWN_COORDS = [(ex.latitude, ex.longitude) for ex in EXAMPLES if ex.latitude and ex.longitude]
+LOCATION_PARTS = {
+    (lat, lon): Part(text=f"\n\n[Location context: I'm near coordinates {lat}, {lon}]")
+    for (lat, lon) in KNOWN_COORDS
+}
+
+
+def build_content(question, latitude=None, longitude=None):
+    """Build the user message for a question, with location context if coordinates are provided."""
+    if (latitude, longitude) in LOCATION_PARTS:
+        return Content(role='user', parts=[Part(text=question), LOCATION_PARTS[(latitude, longitude)]])
 
-    # Include location context in the message if coordinates are provided
     if latitude and longitude:
         question_with_context = f"{question}\n\n[Location context: I'm near coordinates {latitude}, {longitude}]"
     else:
         question_with_context = question
 
-    # Create the message
-    content = Content(role='user', parts=[Part(text=question_with_context)])
+    return Content(role='user', parts=[Part(text=question_with_context)])
 
-    # Run the agent
-    events = runner.run_async(
-        user_id=user_id,
-        session_id=session_id,
-        new_message=content
-    )
 
-    # Collect the response
-    response_parts = []
-    async for event in events:
-        if event.is_final_response():
-            response_parts.append(event.content.parts[0].text)
+# The example messages never change, so build them once at import
+EXAMPLE_CONTENTS = [
+    build_content(ex.question, ex.latitude, ex.longitude)
+    for ex in EXAMPLES
+]
 
-    return '\n'.join(response_parts) if response_parts else "No response received"
+# Caps how many agent requests are in flight at once. Past the quota limit more
+# concurrency only makes response times worse; around 75% of the highest
+# concurrency that stays stable in testing is a good setting.
+# The semaphore is created inside the running loop and rebuilt when a new loop
+# is used, since a semaphore is tied to the loop it first waits on.
+def _validate_concurrency(n):
+    """Return ``n`` if it is a usable in-flight request limit, else raise ValueError."""
+    if n < 1:
+        raise ValueError(f"max concurrency must be at least 1, got {n}")
+    return n
 
 
-async def run_examples():
-    """Run simple usage examples."""
-    print("🌍 Location-Aware Agent - Simple Usage Examples")
-    print("=" * 60)
+try:
+    _MAX_CONCURRENCY = _validate_concurrency(int(os.getenv("AGENT_MAX_CONCURRENCY", "4")))
+except ValueError as e:
+    raise ValueError(f"invalid AGENT_MAX_CONCURRENCY: {e}") from None
+_INFLIGHT = None  # (event loop, semaphore)
 
-    # Create the agent runner
-    runner, user_id, session_id = await create_agent_runner()
 
-    # Example 1: Find restaurants
-    print("\n1. 🍽️ Finding Restaurants")
-    print("-" * 30)
+# Per-process cache of answers keyed by (user, session, question, latitude,
+# longitude), so repeating a question within the TTL skips the agent call.
+# Set AGENT_CACHE=0 to disable it.
+_CACHE_TTL = int(os.getenv("AGENT_CACHE_TTL", "300"))
+_CACHE_MAXSIZE = 256
+_RESP_CACHE = OrderedDict()  # key -> (expiry time, answer), least recently used first
 
-    response = await ask_agent(
-        runner, user_id, session_id,
-        "What are some good restaurants near Times Square in New York?",
-        latitude=40.7580,  # Times Square coordinates
-        longitude=-73.9855
-    )
-    print("Q: What are some good restaurants near Times Square in New York?")
-    print(f"A: {response}\n")
 
-    # Example 2: Travel recommendations
-    print("2. ✈️ Travel Recommendations")
-    print("-" * 30)
+def _cache_get(key):
+    """Return the cached answer for ``key``, or None if it is missing or expired."""
+    entry = _RESP_CACHE.get(key)
+    if entry is None:
+        return None
+    expires_at, response = entry
+    if expires_at <= time.monotonic():
+        del _RESP_CACHE[key]
+        return None
+    _RESP_CACHE.move_to_end(key)
+    return response
 
-    response = await ask_agent(
-        runner, user_id, session_id,
-        "I'm visiting Paris for 3 days. What are the must-see attractions and good places to eat?",
-        latitude=48.8566,  # Paris coordinates
-        longitude=2.3522
-    )
-    print("Q: I'm visiting Paris for 3 days. What are the must-see attractions and good places to eat?")
-    print(f"A: {response}\n")
 
-    # Example 3: Local time and weather
-    print("3. 🕐 Local Information")
-    print("-" * 25)
+def _cache_put(key, response):
+    """Cache ``response`` under ``key``, evicting the least recently used entries."""
+    _RESP_CACHE[key] = (time.monotonic() + _CACHE_TTL, response)
+    _RESP_CACHE.move_to_end(key)
+    while len(_RESP_CACHE) > _CACHE_MAXSIZE:
+        _RESP_CACHE.popitem(last=False)
 
-    response = await ask_agent(
-        runner, user_id, session_id,
-        "What time is it in Tokyo right now? Also, what's the weather like there?"
-    )
-    print("Q: What time is it in Tokyo right now? Also, what's the weather like there?")
-    print(f"A: {response}\n")
 
-    # Example 4: Directions and navigation
-    print("4. 🗺️ Directions and Navigation")
-    print("-" * 35)
+def _inflight():
+    """Return the in-flight request semaphore for the running event loop."""
+    global _INFLIGHT
+    loop = asyncio.get_running_loop()
+    if _INFLIGHT is None or _INFLIGHT[0] is not loop:
+        _INFLIGHT = (loop, asyncio.Semaphore(_MAX_CONCURRENCY))
+    return _INFLIGHT[1]
 
-    response = await ask_agent(
-        runner, user_id, session_id,
-        "How do I get from the Eiffel Tower to the Louvre Museum in Paris? What's the best way to travel?",
-        latitude=48.8584,  # Eiffel Tower coordinates
-        longitude=2.2945
+
+def set_max_concurrency(n):
+    """Replace the in-flight request limit used by ``ask_agent_content``."""
+    global _MAX_CONCURRENCY, _INFLIGHT
+    _MAX_CONCURRENCY = _validate_concurrency(n)
+    _INFLIGHT = None
+
+
+# Runners and sessions are cached per process so repeated runs (e.g. notebook
+# re-executions) reuse the same objects instead of rebuilding them
+_RUNNERS: dict[str, tuple[Runner, str]] = {}
+_SESSIONS: dict[tuple[str, str], set[str]] = {}
+
+
+async def get_runner(app_name="location_aware_app"):
+    """Return the cached agent runner for ``app_name``, creating it on first use."""
+    if app_name in _RUNNERS:
+        return _RUNNERS[app_name]
+
+    session_service = InMemorySessionService()
+
+    runner = Runner(
+        agent=root_agent,
+        app_name=app_name,
+        session_service=session_service
     )
-    print("Q: How do I get from the Eiffel Tower to the Louvre Museum in Paris?")
-    print(f"A: {response}\n")
 
-    # Example 5: Local recommendations
-    print("5. 🏨 Hotel and Accommodation")
-    print("-" * 30)
+    user_id = "demo_user"
+
+    _RUNNERS[app_name] = (runner, user_id)
+    return runner, user_id
+
 
-    response = await ask_agent(
+async def ensure_session(runner, user_id, session_id):
+    """Create the session on the runner's session service unless it already exists."""
+    known = _SESSIONS.setdefault((runner.app_name, user_id), set())
+    if session_id in known:
+        return
+
+    await runner.session_service.create_session(
+        app_name=runner.app_name,
+        user_id=user_id,
+        session_id=session_id
+    )
+    known.add(session_id)
+
+
+async def ask_agent_content(runner, user_id, session_id, content, stream=True, cache_key=None):
+    """Send a prebuilt message to the agent, printing the answer as it is generated when ``stream`` is set.
+
+    Answers are cached under ``cache_key`` together with the user and session
+    when a key is given, because an answer depends on the session's earlier
+    turns. A cache hit skips the turn, so it is not added to the session.
+    """
+
+    use_cache = cache_key is not None and os.getenv("AGENT_CACHE", "1") == "1"
+    if use_cache:
+        cache_key = (user_id, session_id, cache_key)
+    response = _cache_get(cache_key) if use_cache else None
+    if response is not None:
+        if stream:
+            print(response)
+        return response
+
+    async with _inflight():
+        # Run the agent, asking for partial (token-streamed) events when streaming
+        events = runner.run_async(
+            user_id=user_id,
+            session_id=session_id,
+            new_message=content,
+            run_config=RunConfig(streaming_mode=StreamingMode.SSE if stream else StreamingMode.NONE)
+        )
+
+        # Collect the response, printing partial chunks as they arrive
+        streamed = io.StringIO()
+        final = io.StringIO()
+        async for event in events:
+            text = ""
+            if event.content and event.content.parts:
+                # With thinking on, thought parts can come before the answer text
+                text = "".join(p.text for p in event.content.parts if p.text and not p.thought)
+            if text:
+                if event.partial:
+                    if stream:
+                        print(text, end='', flush=True)
+                    streamed.write(text)
+                elif event.is_final_response():
+                    final.write(text)
+                    final.write('\n')
+
+            # Stop reading once the answer is in and release the underlying stream
+            if event.is_final_response():
+                await close_events(events)
+                break
+
+        # The final event repeats the streamed text, so prefer the streamed chunks
+        response = streamed.getvalue() or final.getvalue().rstrip('\n')
+
+        if stream:
+            if streamed.tell():
+                print()
+            else:
+                # No partial events arrived, so print the whole answer at once
+                print(response or "No response received")
+        if not response:
+            return "No response received"
+
+        if use_cache:
+            _cache_put(cache_key, response)
+        return response
+
+
+async def ask_agent(runner, user_id, session_id, question, latitude=None, longitude=None, stream=True):
+    """Ask the agent a question, printing the answer as it is generated when ``stream`` is set."""
+    return await ask_agent_content(
         runner, user_id, session_id,
-        "I need a hotel near Central Park in New York. What are some good options with good reviews?",
-        latitude=40.7829,  # Central Park coordinates
-        longitude=-73.9654
+        build_content(question, latitude, longitude),
+        stream=stream,
+        cache_key=(question, latitude, longitude)
     )
-    print("Q: I need a hotel near Central Park in New York. What are some good options?")
-    print(f"A: {response}\n")
 
-    # Example 6: Distance and travel time
-    print("6. 📏 Distance and Travel Time")
-    print("-" * 35)
 
-    response = await ask_agent(
-        runner, user_id, session_id,
-        "How far is it from London to Paris? What are the different ways to travel between these cities?"
+async def run_examples():
+    """Run simple usage examples."""
+    print("🌍 Location-Aware Agent - Simple Usage Examples")
+    print("=" * 60)
+
+    # Create the agent runner
+    runner, user_id = await get_runner()
+
+    # One session per topic, so related questions share conversation context
+    for ex in EXAMPLES:
+        await ensure_session(runner, user_id, ex.topic)
+
+    # Stream the first example so its answer shows up as it is generated
+    first = EXAMPLES[0]
+    print(f"\n{first.heading}")
+    print("-" * first.width)
+    print(f"Q: {first.shown_question}")
+    print("A: ", end='', flush=True)
+    await ask_agent_content(
+        runner, user_id, first.topic,
+        EXAMPLE_CONTENTS[0],
+        stream=True,
+        cache_key=(first.question, first.latitude, first.longitude)
     )
-    print("Q: How far is it from London to Paris? What are the travel options?")
-    print(f"A: {response}\n")
+    print()
+
+    # Group the remaining examples by topic, keeping each topic's questions in order
+    topics = {}
+    for i, ex in enumerate(EXAMPLES[1:], start=1):
+        topics.setdefault(ex.topic, []).append(i)
+
+    responses = [None] * len(EXAMPLES)
+
+    async def ask_topic(topic, indices):
+        for i in indices:
+            ex = EXAMPLES[i]
+            responses[i] = await ask_agent_content(
+                runner, user_id, topic,
+                EXAMPLE_CONTENTS[i],
+                stream=False,
+                cache_key=(ex.question, ex.latitude, ex.longitude)
+            )
+
+    # Topics run concurrently and ask_agent_content bounds how many requests are in
+    # flight. Answers are printed in order afterwards, so streaming is turned
+    # off to keep concurrent output from interleaving.
+    await asyncio.gather(*(ask_topic(topic, indices) for topic, indices in topics.items()))
+
+    # Print the remaining results in the original order
+    for ex, response in zip(EXAMPLES[1:], responses[1:]):
+        print(ex.heading)
+        print("-" * ex.width)
+        print(f"Q: {ex.shown_question}")
+        print(f"A: {response}\n")
 
 
 async def main():
@@ -180,8 +374,14 @@ async def main():
         print("2. Ensure you have proper Google Cloud/AI Studio credentials")
         print("3. Verify your internet connection")
         print("4. Make sure all dependencies are installed: pip install -r requirements.txt")
+        print("5. Install this project so 'location_agent' is importable: pip install -e .")
 
 
 if __name__ == "__main__":
-    # Run the examples
-    asyncio.run(main())
\ No newline at end of file
+    # Use the faster uvloop event loop where it is available (not on Windows)
+    try:
+        import uvloop
+    except ImportError:
+        asyncio.run(main())
+    else:
+        uvloop.run(main())
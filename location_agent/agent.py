@@ -7,62 +7,102 @@ rather than custom tools, making it simple and easy to understand.
 """
 
 import os
-from dotenv import load_dotenv
-from google.adk.agents import LlmAgent
-from google.adk.tools import google_maps_grounding
-from google.genai.types import Content, Part, ThinkingConfig
-from google.adk.planners import BuiltInPlanner
-
-# Load environment variables
-load_dotenv()
-
-# The base agent with the core logic, instructions, and tools.
-_base_agent = LlmAgent(
-    name="location_aware_assistant",
-    model="gemini-2.5-flash",
-    description=(
-        "A location-aware AI assistant that answers location-based questions. "
-        "You MUST use the google_maps tool to get information about "
-        "places, businesses, directions, and other real-time data. Do not rely "
-        "on your internal knowledge."
-    ),
-    instruction=(
-        "You are a helpful location-aware assistant with access to Google Maps data. "
-        "**Your primary rule is to ALWAYS use the `google_maps` tool "
-        "for any location-based questions.** Your internal knowledge is outdated, "
-        "so you must rely on the tool for accuracy.\n\n"
-        "You can help users with:\n\n"
-        "🗺️ **Location Information:**\n"
-        "- Find specific places, addresses, and businesses\n"
-        "- Provide current business hours, reviews, and contact information\n"
-        "- Give directions and navigation help\n"
-        "- Share details about attractions and points of interest\n\n"
-        "🌍 **Travel & Local Help:**\n"
-        "- Recommend restaurants, hotels, and attractions\n"
-        "- Suggest things to do based on user interests\n"
-        "- Provide local insights and travel tips\n"
-        "- Help with trip planning and itineraries\n\n"
-        "**Guidelines:**\n"
-        "- **MUST USE TOOL**: For any queries about places, businesses, directions, "
-        "hours, and other real-time data, you must use the `google_maps` "
-        "tool. Do not answer from memory.\n"
-        "- **ATTRIBUTE**: Provide proper attribution to Google Maps when using map "
-        "data (e.g., 'According to Google Maps...').\n"
-        "- **CLARIFY**: Ask for clarification if a user's location or request is "
-        "unclear.\n"
-        "- **BE HELPFUL**: Be friendly, informative, and focus on providing current, "
-        "practical information that helps the user."
-    ),
-    tools=[google_maps_grounding],
-    planner=BuiltInPlanner(
-        thinking_config=ThinkingConfig(
-            include_thoughts=True
-        )
-    )
+from typing import Final
+
+# Agent prompt text, kept as module constants so every build reuses the same strings
+_DESCRIPTION: Final[str] = (
+    "A location-aware AI assistant that answers location-based questions. "
+    "You MUST use the google_maps tool to get information about "
+    "places, businesses, directions, and other real-time data. Do not rely "
+    "on your internal knowledge."
+)
+
+_INSTRUCTION: Final[str] = (
+    "You are a helpful location-aware assistant with access to Google Maps data. "
+    "**Your primary rule is to ALWAYS use the `google_maps` tool "
+    "for any location-based questions.** Your internal knowledge is outdated, "
+    "so you must rely on the tool for accuracy.\n\n"
+    "You can help users with:\n\n"
+    "🗺️ **Location Information:**\n"
+    "- Find specific places, addresses, and businesses\n"
+    "- Provide current business hours, reviews, and contact information\n"
+    "- Give directions and navigation help\n"
+    "- Share details about attractions and points of interest\n\n"
+    "🌍 **Travel & Local Help:**\n"
+    "- Recommend restaurants, hotels, and attractions\n"
+    "- Suggest things to do based on user interests\n"
+    "- Provide local insights and travel tips\n"
+    "- Help with trip planning and itineraries\n\n"
+    "**Guidelines:**\n"
+    "- **MUST USE TOOL**: For any queries about places, businesses, directions, "
+    "hours, and other real-time data, you must use the `google_maps` "
+    "tool. Do not answer from memory.\n"
+    "- **ATTRIBUTE**: Provide proper attribution to Google Maps when using map "
+    "data (e.g., 'According to Google Maps...').\n"
+    "- **CLARIFY**: Ask for clarification if a user's location or request is "
+    "unclear.\n"
+    "- **BE HELPFUL**: Be friendly, informative, and focus on providing current, "
+    "practical information that helps the user."
 )
 
+_LOADED = False
+_root = None
+
+
+def _load_env():
+    """Load environment variables from .env, at most once per process.
+
+    Set AGENT_SKIP_DOTENV=1 to skip the .env search entirely, e.g. in containers
+    where the orchestrator injects the whole environment. Variables that are
+    already set are never overridden by the file.
+    """
+    global _LOADED
+    if not _LOADED:
+        if os.environ.get("AGENT_SKIP_DOTENV") != "1":
+            from dotenv import load_dotenv
+            load_dotenv()
+        _LOADED = True
+
+
+def _build_root_agent():
+    """Build the base agent with the core logic, instructions, and tools."""
+    from google.adk.agents import LlmAgent
+    from google.adk.models import Gemini
+    from google.adk.tools import google_maps_grounding
+    from google.genai.types import ThinkingConfig
+    from google.adk.planners import BuiltInPlanner
+
+    _load_env()
+
+    # gemini-2.5-flash thinks by default, which adds latency and tokens to every
+    # turn. Thinking is turned off unless AGENT_THOUGHTS=1, which turns it on and
+    # returns the thoughts for debugging.
+    if os.getenv("AGENT_THOUGHTS") == "1":
+        thinking_config = ThinkingConfig(include_thoughts=True)
+    else:
+        thinking_config = ThinkingConfig(thinking_budget=0)
+    planner = BuiltInPlanner(thinking_config=thinking_config)
+
+    return LlmAgent(
+        name="location_aware_assistant",
+        # A model instance (rather than a model name) keeps a single underlying
+        # genai client, so its pooled keep-alive connections are reused on every
+        # turn instead of a new client and TLS handshake per request.
+        model=Gemini(model="gemini-2.5-flash"),
+        description=_DESCRIPTION,
+        instruction=_INSTRUCTION,
+        tools=[google_maps_grounding],
+        planner=planner
+    )
+
 
-root_agent = _base_agent
+def __getattr__(name):
+    """Build ``root_agent`` on first access so importing this module stays cheap."""
+    if name == "root_agent":
+        global _root
+        _root = _root or _build_root_agent()
+        return _root
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 # Export the main agent for ADK to use
@@ -0,0 +1,13 @@
+"""
+Helpers for consuming the event stream returned by ``Runner.run_async``.
+"""
+
+
+async def close_events(events):
+    """Close an agent event stream early so the underlying model stream is released.
+
+    Iterators without an ``aclose`` method are left alone.
+    """
+    aclose = getattr(events, "aclose", None)
+    if aclose:
+        await aclose()